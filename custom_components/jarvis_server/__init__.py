@@ -1,15 +1,58 @@
 from __future__ import annotations
 
+import aiohttp
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.util.ssl import get_default_context
+
+from .const import DATA_CONNECTOR, DATA_ENTRIES, DOMAIN
 
 PLATFORMS: list[str] = ["conversation"]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_CONNECTOR not in domain_data:
+        # One keep-alive pool for the whole integration; every agent session
+        # is built on it so connections to the server are shared. Uses HA's
+        # default SSL context so TLS behaves like HA's own sessions.
+        domain_data[DATA_CONNECTOR] = aiohttp.TCPConnector(
+            ssl=get_default_context(),
+            limit=32,
+            limit_per_host=8,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+        )
+    domain_data.setdefault(DATA_ENTRIES, set()).add(entry.entry_id)
+    connector: aiohttp.TCPConnector = domain_data[DATA_CONNECTOR]
+
+    async def _async_close_connector(_event: Event) -> None:
+        # HA does not unload config entries on shutdown, so close the pool here.
+        await connector.close()
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_connector))
+
+    try:
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    except Exception:
+        await _async_release_connector(hass, entry)
+        raise
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await _async_release_connector(hass, entry)
+    return unload_ok
+
+
+async def _async_release_connector(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the entry's use of the shared pool; close it once the last entry is gone."""
+    domain_data = hass.data[DOMAIN]
+    domain_data[DATA_ENTRIES].discard(entry.entry_id)
+    if not domain_data[DATA_ENTRIES]:
+        hass.data.pop(DOMAIN)
+        await domain_data[DATA_CONNECTOR].close()
@@ -1,7 +1,13 @@
 DOMAIN = "jarvis_server"
 
+# Keys in hass.data[DOMAIN]
+DATA_CONNECTOR = "connector"
+DATA_ENTRIES = "entries"
 
 CONF_BASE_URL = "base_url"
 CONF_API_KEY = "api_key"
 
 DEFAULT_TIMEOUT_SECONDS = 20
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 2
+
+MAX_REPLY_BYTES = 64 * 1024
@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from dataclasses import dataclass
-from typing import Any, Literal
+from typing import Any, Literal, final
 
 import aiohttp
 
@@ -13,15 +11,33 @@ from homeassistant.components.conversation import ChatLog, ConversationEntity
 from homeassistant.components.conversation.chat_log import AssistantContent
 from homeassistant.components.conversation.models import ConversationInput, ConversationResult
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, MATCH_ALL
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import intent
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from .const import (
+    CONF_API_KEY,
+    CONF_BASE_URL,
+    DATA_CONNECTOR,
+    DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    DEFAULT_TIMEOUT_SECONDS,
+    DOMAIN,
+    MAX_REPLY_BYTES,
+)
 
+_LOGGER = logging.getLogger(__name__)
 
-from .const import DOMAIN, CONF_BASE_URL
 
-_LOGGER = logging.getLogger(__name__)
+class _InvalidReplyError(Exception):
+    """Raised when the server reply is not valid JSON."""
+
+
+class _ReplyTooLargeError(Exception):
+    """Raised when the server reply exceeds MAX_REPLY_BYTES."""
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -32,17 +48,20 @@ async def async_setup_entry(
     async_add_entities([JarvisServerConversationAgent(hass, entry)])
 
 
-@dataclass(frozen=True)
-class _ServerReply:
-    text: str
-
-
+@final
 class JarvisServerConversationAgent(ConversationEntity):
     """A conversation entity that forwards text to an external server."""
 
     _attr_has_entity_name = True
     _attr_name = "Jarvis Server"
 
+    # Spoken replies for the known failure/fallback cases.
+    _ERR_INVALID_REPLY = "The server sent an invalid reply."
+    _ERR_REPLY_TOO_LARGE = "The server reply was too large."
+    _ERR_UNREACHABLE = "Could not reach the server ({})."
+    _ERR_UNEXPECTED = "Unexpected server error."
+    _FALLBACK_REPLY = "Ok, Jarvis will help"
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.hass = hass
         self.entry = entry
@@ -50,8 +69,64 @@ class JarvisServerConversationAgent(ConversationEntity):
         # Unique ID is important so HA can track the entity correctly.
         self._attr_unique_id = f"{entry.entry_id}_conversation"
 
-        self._session = async_get_clientsession(hass)
-        self._server_url: str = entry.data.get(CONF_BASE_URL).rstrip("/")
+        self._session = aiohttp.ClientSession(
+            # Sessions share the integration's connector, which compared to HA's
+            # shared session keeps idle connections longer (75 s), limits
+            # connections per host and caches DNS for 5 minutes. The connector is
+            # owned (and closed) by __init__.py.
+            connector=hass.data[DOMAIN][DATA_CONNECTOR],
+            connector_owner=False,
+            # A short socket-connect timeout fails fast when the server is down,
+            # without limiting how long a turn may wait for a free connection
+            # from the pool.
+            timeout=aiohttp.ClientTimeout(
+                total=DEFAULT_TIMEOUT_SECONDS,
+                sock_connect=DEFAULT_CONNECT_TIMEOUT_SECONDS,
+            ),
+        )
+
+        # Built once; these do not change for the lifetime of the entry, so the
+        # hot path only reads self._converse_url and self._headers.
+        data = entry.data
+        # ConfigFlow stores the base URL already stripped of any trailing "/".
+        self._server_url: str = data[CONF_BASE_URL]
+        # You can change the endpoint/path as you like.
+        self._converse_url = f"{self._server_url}/converse"
+        api_key: str = data.get(CONF_API_KEY, "")
+        self._headers: dict[str, str] = {"Content-Type": "application/json"}
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Close the HTTP session on shutdown too; HA does not remove entities then."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, self._async_close_session)
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Close the HTTP session when the entity is removed."""
+        await self._session.close()
+
+    async def _async_close_session(self, _event: Event) -> None:
+        """Close the HTTP session when Home Assistant shuts down."""
+        await self._session.close()
+
+    async def async_prepare(self, language: str | None = None) -> None:
+        """Open a connection to the server ahead of the first turn.
+
+        Parks a keep-alive connection in the pool so the first message does not
+        pay for the TCP (+ TLS) handshake. Failures are ignored.
+        """
+        try:
+            async with self._session.head(
+                self._server_url,
+                allow_redirects=False,
+                timeout=aiohttp.ClientTimeout(total=DEFAULT_CONNECT_TIMEOUT_SECONDS),
+            ):
+                pass
+        except (aiohttp.ClientError, TimeoutError) as e:
+            _LOGGER.debug("Jarvis Server warm-up failed, will connect on first turn: %s", e)
 
     @property
     def supported_languages(self) -> list[str] | Literal["*"]:
@@ -59,7 +134,7 @@ class JarvisServerConversationAgent(ConversationEntity):
 
         Return "*" to support all languages (HA will still provide user_input.language).
         """
-        return "*"
+        return MATCH_ALL
 
     async def _async_handle_message(
         self,
@@ -68,35 +143,26 @@ class JarvisServerConversationAgent(ConversationEntity):
     ) -> ConversationResult:
         """Handle the incoming message and return a ConversationResult."""
         try:
-            reply = await self._call_server(user_input, chat_log)
-            speech_text = reply.text
-
-            # Add assistant message to chat log (so multi-turn + UI history works nicely).
-            chat_log.async_add_assistant_content_without_tools(
-                AssistantContent(
-                    agent_id=user_input.agent_id,
-                    content=speech_text,
-                )
-            )
-
-            resp = intent.IntentResponse(language=user_input.language)
-            resp.async_set_speech(speech_text)
-
-            return ConversationResult(
-                conversation_id=user_input.conversation_id,
-                response=resp,
-                continue_conversation=False,
-            )
-
-        except Exception as e:  # noqa: BLE001 - we want a safe catch-all for voice UX
-            _LOGGER.exception("Jarvis Server error while handling message: %s", e)
-            return self._error_result(user_input, chat_log, f"Could not reach the server ({type(e).__name__}).")
-
-    async def _call_server(self, user_input: ConversationInput, chat_log: ChatLog) -> _ServerReply:
+            speech_text = await self._call_server(user_input, chat_log)
+        except _ReplyTooLargeError as e:
+            _LOGGER.warning("Jarvis Server reply rejected: %s", e)
+            return self._speech_result(user_input, chat_log, self._ERR_REPLY_TOO_LARGE)
+        except (aiohttp.ClientPayloadError, _InvalidReplyError) as e:
+            # Truncated body or invalid JSON.
+            _LOGGER.debug("Jarvis Server sent a bad reply: %s", e)
+            return self._speech_result(user_input, chat_log, self._ERR_INVALID_REPLY)
+        except (aiohttp.ClientError, TimeoutError) as e:
+            # Expected when the server is down/slow; no traceback needed.
+            _LOGGER.warning("Jarvis Server error while handling message: %s (%s)", type(e).__name__, e)
+            return self._speech_result(user_input, chat_log, self._ERR_UNREACHABLE.format(type(e).__name__))
+        except Exception:  # noqa: BLE001 - we want a safe catch-all for voice UX
+            _LOGGER.exception("Unexpected error while handling Jarvis Server message")
+            return self._speech_result(user_input, chat_log, self._ERR_UNEXPECTED)
+
+        return self._speech_result(user_input, chat_log, speech_text)
+
+    async def _call_server(self, user_input: ConversationInput, chat_log: ChatLog) -> str:
         """Send the user text to the external server and return the reply."""
-        # You can change the endpoint/path as you like.
-        url = f"{self._server_url}/converse"
-
         payload: dict[str, Any] = {
             "text": user_input.text,
             "language": user_input.language,
@@ -104,24 +170,42 @@ class JarvisServerConversationAgent(ConversationEntity):
             "agent_id": user_input.agent_id,
         }
 
-        timeout = aiohttp.ClientTimeout(total=15)
+        # Encode straight to bytes with HA's orjson-backed helper; aiohttp's json=
+        # path would produce a str and then encode it again.
+        request_body = json_bytes(payload)
 
-        async with self._session.post(url, json=payload, timeout=timeout) as r:
+        async with self._session.post(self._converse_url, data=request_body, headers=self._headers) as r:
             # Raise on non-2xx so we end up in the standard error path.
             r.raise_for_status()
 
-            data = await r.json()
+            # Read the body ourselves with a size cap, so a misbehaving server
+            # cannot make us buffer an arbitrarily large reply.
+            if r.content_length is not None and r.content_length > MAX_REPLY_BYTES:
+                raise _ReplyTooLargeError(f"Reply exceeds {MAX_REPLY_BYTES} bytes")
+            body = bytearray()
+            async for chunk in r.content.iter_any():
+                body += chunk
+                if len(body) > MAX_REPLY_BYTES:
+                    raise _ReplyTooLargeError(f"Reply exceeds {MAX_REPLY_BYTES} bytes")
+
+        # Only the decode is guarded: aiohttp's InvalidURL is also a ValueError, and
+        # a misconfigured base URL must surface as a transport error, not a bad reply.
+        try:
+            data = json_loads(body)
+        except ValueError as e:
+            raise _InvalidReplyError(str(e)) from e
 
         # Expect either {"text": "..."} or {"response": "..."} (accept both).
-        text = (data.get("text") or data.get("response") or "").strip()
-        if not text:
-            text = "Ok, Jarvis will help"
+        text = (data.get("text") or data.get("response")) if isinstance(data, dict) else None
+        if not isinstance(text, str) or not (text := text.strip()):
+            text = self._FALLBACK_REPLY
 
-        return _ServerReply(text=text)
+        return text
 
-    def _error_result(self, user_input: ConversationInput, chat_log: ChatLog, message: str) -> ConversationResult:
-        """Return an error result that HA can speak."""
-        # Add an assistant message to history (useful for debugging in UI).
+    def _speech_result(self, user_input: ConversationInput, chat_log: ChatLog, message: str) -> ConversationResult:
+        """Return a result that HA can speak, for both replies and errors."""
+        # HA does not record the agent's speech on its own; add it to the chat
+        # log so multi-turn + UI history works nicely (also useful for debugging).
         chat_log.async_add_assistant_content_without_tools(
             AssistantContent(
                 agent_id=user_input.agent_id,